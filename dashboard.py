@@ -7,7 +7,9 @@ visualizer next to a CLI console and a monitor log pane. Supports USB serial
 and BLE (Nordic UART Service).
 
 Key performance notes:
-- Qt event loop with QTimer for steady 30 Hz plot updates and queue draining.
+- Qt event loop with a precise QTimer for steady 30 Hz plot updates that
+  stops while telemetry is idle; queues are drained on demand when the I/O
+  threads signal new items.
 - Matplotlib QtAgg canvas with constrained re-draws (no cache_frame_data).
 - All I/O stays off the GUI thread; GUI pulls from thread-safe queues.
 
@@ -25,19 +27,21 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import base64
-import glob
+import codecs
+import functools
 import json
 import math
-import queue
+import os
 import re
 import signal
+import socket
 import sys
 import threading
 import time
 from collections import deque
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Callable, Optional, Tuple, TYPE_CHECKING, cast
+from typing import Any, Callable, Generic, Optional, Tuple, TYPE_CHECKING, TypeVar, cast
 
 import numpy as np
 
@@ -46,10 +50,18 @@ import numpy as np
 # Font configuration
 MONOSPACE_FONT_SIZE = 13
 
-FUSION_Q_RE = re.compile(r"FUSION\s+q:\[([^\]]+)\]")
-SFLP_Q_RE = re.compile(r"SFLP\s+q:\[([^\]]+)\]")
-POSITION_RE = re.compile(r"POS\s*:\[([^\]]+)\]")
-MAG_RE = re.compile(r"M:\[([^\]]+)\]")
+# One scan per line finds every record for ingest_line; PUNCH_RE/FLEX_RE then
+# extract fields. A line can carry several records (e.g. FUSION and POS). The
+# alternatives start with distinct literals, so at most one matches at a given
+# offset; parse_telemetry_line rescans inside a payload that fails to parse.
+TELEMETRY_RE = re.compile(
+    r"FUSION\s+q:\[(?P<fusion>[^\]]+)\]"
+    r"|SFLP\s+q:\[(?P<sflp>[^\]]+)\]"
+    r"|POS\s*:\[(?P<pos>[^\]]+)\]"
+    r"|M:\[(?P<mag>[^\]]+)\]"
+    r"|(?P<punch>(?i:Punch detected:))"
+    r"|(?P<flex>(?i:FLEX:))"
+)
 FLEX_RE = re.compile(
     r"FLEX:\s*Flex value changed:\s*(\d+)\s*->\s*(\d+)\s*\(raw median:\s*(\d+),\s*MIDI:\s*(\d+)\)",
     re.IGNORECASE,
@@ -64,96 +76,255 @@ DEFAULT_WRITE_CHUNK = 20
 LOG_LINE_RE = re.compile(
     r"^(?P<level>[EWIDV]) \((?P<timestamp>\d+)\) (?P<tag>[^:]+): (?P<message>.*)$"
 )
-LOG_PREFIXES = tuple(f"{lvl} (" for lvl in "EWIDV")
-ANSI_PREFIX_RE = re.compile(r"^(?:\x1b\[[0-9;]*m)+")
+LOG_PREFIX_RE = re.compile(r"[EWIDV] \(")
+ANSI_SGR_RE = re.compile(r"\x1b\[[0-9;]*m")
+NEWLINE_RE = re.compile(r"\r\n?|\n")
+JSON_DECODER = json.JSONDecoder()
+MAX_DRAIN = 1000
 SUPPRESSED_MONITOR_TAGS = {"FUSION", "MOTION", "FLEX"}
 BATT_RE = re.compile(r"BATT:\s*([0-9.]+)\s*%\s*([0-9.]+)\s*V")
 RSSI_RE = re.compile(r"RSSI[:=]\s*(-?\d+)\s*dBm", re.IGNORECASE)
+# Monitor lines the info bar already shows, removed from a joined batch of
+# dispatcher output (one well-formed log line per row) in a single pass.
+MONITOR_HIDDEN_RE = re.compile(
+    r"^[EWIDV] \(\d+\) \s*(?i:BATT|RSSI)\s*:.*\n", re.MULTILINE
+)
 PUNCH_RE = re.compile(
     r"Punch detected:\s*([0-9.+-]+)\s*m/s\s*hv=([0-9.+-]+)\s*deg\s*vv=([0-9.+-]+)\s*deg",
     re.IGNORECASE,
 )
-
-LAYOUT_STATE_FILE = Path(__file__).resolve().parent / ".dashboard_layout_qt.json"
+PREFERRED_PORT_RE = re.compile(r"tty\.usbmodem|tty\.SLAB|ttyUSB|cu\.usb|cu\.SLAB")
+REJECTED_PORT_RE = re.compile(r"bluetooth|airpods|iap|modem", re.IGNORECASE)
+
+# Status queue items are (tag, *args) tuples; the GUI formats only the message
+# it ends up showing. Each tag maps to its status-line template and the
+# transport description it implies (None leaves the description unchanged).
+STATUS_MESSAGES: dict[str, Tuple[str, Optional[str]]] = {
+    "serial_waiting": ("Serial waiting for device on {}...", "Serial (reconnecting)"),
+    "serial_connected": ("Serial connected: {} @ {}", "Serial {} @ {}"),
+    "serial_failed": ("Serial connection failed: {}, retrying...", "Serial (disconnected)"),
+    "serial_lost": ("Serial disconnected, reconnecting: {}", "Serial (disconnected)"),
+    "serial_closed": ("Serial disconnected", "Serial (disconnected)"),
+    "ble_unavailable": ("BLE unavailable: {}", "BLE (unavailable)"),
+    "ble_connecting": ("BLE: connecting to {} ...", None),
+    "ble_scanning": (
+        "BLE: scanning for devices matching '{}' ({:.1f}s timeout)",
+        "BLE (scanning)",
+    ),
+    "ble_found": ("BLE: found {} ({}). Connecting...", "BLE found {} ({}). Connecting..."),
+    "ble_not_found": ("BLE: device not found.", "BLE (reconnecting)"),
+    "ble_rescan": ("BLE: device not found, retrying scan...", "BLE (reconnecting)"),
+    "ble_connected": ("BLE connected. Receiving notifications...", "BLE (connected)"),
+    "ble_lost": ("BLE disconnected, reconnecting...", "BLE (reconnecting)"),
+    "ble_error": ("BLE connection error: {}, reconnecting...", "BLE (reconnecting)"),
+    "ble_retry_failed": ("BLE reconnect attempt {} failed: {}", "BLE (reconnecting)"),
+    "ble_closed": ("BLE disconnected", "BLE (reconnecting)"),
+    "ble_fallback": ("BLE: falling back to serial.", "Serial (connecting)"),
+    "command_skipped": ("Transport unavailable; command skipped.", None),
+    "command_failed": ("Command send failed: {}", None),
+}
+StatusItem = Tuple[Any, ...]
+
+INFO_BAR_FORMAT = "Transport: %s | %s | %s"
+BATTERY_FORMAT = "Battery: %s%%"
+BATTERY_VOLTAGE_FORMAT = "Battery: %s%% (%sV)"
+RSSI_FORMAT = "RSSI: %s dBm"
+FLEX_LABEL_FORMAT = "MIDI: %3d  Raw: %s  Index: %s"
+ANGLES_FORMAT = "[%s] Roll: %+.1f deg, Pitch: %+.1f deg, Yaw: %+.1f deg"
+POSITION_FORMAT = "Pos: (%+.2f, %+.2f, %+.2f)"
+HEADING_FORMAT = "Heading: %+.1f°"
+FIELD_FORMAT = "|B|: %5.1f µT"
+FLEX_IDLE_TEXT = "MIDI: --  Raw: --  Index: --"
+# Keyed by TelemetrySnapshot.source, which is None until a quaternion lands.
+ORIENTATION_SOURCE_LABELS: dict[Optional[str], str] = {"fusion": "Fusion", "sflp": "SFLP"}
+DEG_TO_RAD = math.pi / 180.0
+
+# Raw QWidget.saveGeometry() bytes; nothing else is persisted.
+LAYOUT_STATE_FILE = Path(__file__).resolve().parent / ".dashboard_layout_qt.bin"
 
 # ----------------------------- Utility functions ------------------------------
 
 
 def parse_quat(s: str) -> Optional[Tuple[float, float, float, float]]:
     try:
-        parts = [p.strip() for p in s.split(",")]
+        parts = s.split(",")
         if len(parts) != 4:
             return None
-        q = np.array(list(map(float, parts)), dtype=float)
-        n = np.linalg.norm(q)
-        if n == 0 or not np.isfinite(n):
+        w, x, y, z = (float(p) for p in parts)
+        n = math.hypot(w, x, y, z)
+        if n == 0.0 or not math.isfinite(n):
             return None
-        q /= n
-        return (float(q[0]), float(q[1]), float(q[2]), float(q[3]))
+        return (w / n, x / n, y / n, z / n)
     except Exception:
         return None
 
 
 def parse_vec3(s: str) -> Optional[Tuple[float, float, float]]:
     try:
-        parts = [p.strip() for p in s.split(",")]
+        parts = s.split(",")
         if len(parts) != 3:
             return None
-        vec = tuple(float(p) for p in parts)
-        if not np.isfinite(np.array(vec)).all():
+        x, y, z = (float(p) for p in parts)
+        if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(z)):
             return None
-        return vec  # type: ignore[return-value]
+        return (x, y, z)
     except Exception:
         return None
 
 
-def quat_to_rotation_matrix(q: Tuple[float, float, float, float]) -> np.ndarray:
+def parse_punch(
+    line: str, start: int, body: int
+) -> Optional[Tuple[float, float, float]]:
+    # Literal splits on the firmware's fixed format; PUNCH_RE (anchored at
+    # `start`) covers spacing or case drift. Tokens are held to PUNCH_RE's
+    # [0-9.+-]+ (float() alone would take "1e1", "1_0" or "inf") and may only
+    # be padded where PUNCH_RE allows whitespace.
+    try:
+        velocity_text, rest = line[body:].split("m/s hv=", 1)
+        horizontal_text, rest = rest.split("deg vv=", 1)
+        vertical_text, _ = rest.split("deg", 1)
+        velocity_text = velocity_text.strip()
+        horizontal_text = horizontal_text.rstrip()
+        vertical_text = vertical_text.rstrip()
+        for token in (velocity_text, horizontal_text, vertical_text):
+            if not token or token.strip("0123456789.+-"):
+                raise ValueError(token)
+        punch = (float(velocity_text), float(horizontal_text), float(vertical_text))
+    except ValueError:
+        match = PUNCH_RE.match(line, start)
+        if match is None:
+            return None
+        try:
+            punch = (
+                float(match.group(1)),
+                float(match.group(2)),
+                float(match.group(3)),
+            )
+        except ValueError:
+            return None
+    velocity, horizontal, vertical = punch
+    if not (
+        math.isfinite(velocity)
+        and math.isfinite(horizontal)
+        and math.isfinite(vertical)
+    ):
+        return None
+    return punch
+
+
+def parse_flex(line: str, start: int, body: int) -> Optional[Tuple[int, int, int]]:
+    # Same approach as parse_punch, with FLEX_RE as the fallback. Returns
+    # (value, raw median, MIDI); the previous value is validated but dropped.
+    # isdecimal() matches FLEX_RE's \d+, which int() alone does not ("-2",
+    # "4_0").
+    try:
+        lead, rest = line[body:].split("Flex value changed:", 1)
+        if lead.strip():
+            raise ValueError(lead)
+        old, rest = rest.split("->", 1)
+        new, rest = rest.split("(raw median:", 1)
+        raw, rest = rest.split(", MIDI:", 1)
+        midi, _ = rest.split(")", 1)
+        new = new.strip()
+        raw = raw.lstrip()
+        midi = midi.lstrip()
+        if not (
+            old.strip().isdecimal()
+            and new.isdecimal()
+            and raw.isdecimal()
+            and midi.isdecimal()
+        ):
+            raise ValueError(line)
+        return (int(new), int(raw), int(midi))
+    except ValueError:
+        match = FLEX_RE.match(line, start)
+        if match is None:
+            return None
+        return (int(match.group(2)), int(match.group(3)), int(match.group(4)))
+
+
+def rotate_vec_by_quat(
+    q: Tuple[float, float, float, float],
+    v: Tuple[float, float, float],
+    out: np.ndarray,
+    scale: float = 1.0,
+) -> np.ndarray:
+    # v' = v + w*t + q_xyz x t with t = 2 * (q_xyz x v): the same rotation as
+    # the quaternion's matrix, without building the matrix. Written into `out`
+    # (scaled) so the caller's buffer is reused.
     w, x, y, z = q
-    xx = x * x
-    yy = y * y
-    zz = z * z
-    xy = x * y
-    xz = x * z
-    yz = y * z
-    wx = w * x
-    wy = w * y
-    wz = w * z
-    two = 2.0
-    return np.array(
-        [
-            [1.0 - two * (yy + zz), two * (xy - wz), two * (xz + wy)],
-            [two * (xy + wz), 1.0 - two * (xx + zz), two * (yz - wx)],
-            [two * (xz - wy), two * (yz + wx), 1.0 - two * (xx + yy)],
-        ],
-        dtype=float,
+    vx, vy, vz = v
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    out[0] = (vx + w * tx + (y * tz - z * ty)) * scale
+    out[1] = (vy + w * ty + (z * tx - x * tz)) * scale
+    out[2] = (vz + w * tz + (x * ty - y * tx)) * scale
+    return out
+
+
+def _reciprocal(value: float) -> float:
+    return 1.0 / value if value > 0.0 else 0.0
+
+
+def quat_to_euler_deg(
+    q: Tuple[float, float, float, float],
+) -> Tuple[float, float, float]:
+    # Roll, pitch and yaw in degrees; pitch is clamped at the poles.
+    w, x, y, z = q
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    sin_pitch = 2.0 * (w * y - z * x)
+    if sin_pitch > 1.0:
+        sin_pitch = 1.0
+    elif sin_pitch < -1.0:
+        sin_pitch = -1.0
+    pitch = math.asin(sin_pitch)
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return (
+        math.degrees(roll),
+        math.degrees(pitch),
+        math.degrees(yaw),
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_bleak() -> Tuple[Any, Optional[Exception]]:
+    # Imported on first BLE use so serial-only runs never load bleak. The
+    # outcome is cached, including a failure, which sys.modules does not
+    # remember: a retry would otherwise search sys.path all over again.
+    try:
+        import bleak  # type: ignore[import]
+    except Exception as exc:
+        return None, exc
+    return bleak, None
+
+
 def find_default_port() -> Optional[str]:
-    preferred_patterns = [
-        "/dev/tty.usbmodem*",
-        "/dev/tty.SLAB*",
-        "/dev/ttyUSB*",
-        "/dev/cu.usb*",
-        "/dev/cu.SLAB*",
-    ]
-    candidates: list[str] = []
-    for pat in preferred_patterns:
-        candidates.extend(glob.glob(pat))
+    # One /dev listing instead of a glob per pattern.
+    try:
+        with os.scandir("/dev") as entries:
+            names = [entry.name for entry in entries]
+    except OSError:
+        return None
+    candidates = [name for name in names if PREFERRED_PORT_RE.match(name)]
     if not candidates:
-        candidates = glob.glob("/dev/tty.*") + glob.glob("/dev/cu.*")
-    filtered = [
-        p
-        for p in candidates
-        if not any(x in p.lower() for x in ["bluetooth", "airpods", "iap", "modem"])
-    ]
-    ports = filtered or candidates
-    ports = sorted(set(ports))
-    return ports[0] if ports else None
+        candidates = [name for name in names if name.startswith(("tty.", "cu."))]
+    filtered = [name for name in candidates if not REJECTED_PORT_RE.search(name)]
+    ports = sorted(filtered or candidates)
+    return f"/dev/{ports[0]}" if ports else None
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_crlf(text: str) -> bytes:
+    # One pass: every \r\n, \r or \n becomes \r\n, plus a terminating one.
+    payload = NEWLINE_RE.sub("\r\n", text)
+    if not payload.endswith("\r\n"):
+        payload += "\r\n"
+    return payload.encode("utf-8")
 
 
-def _strip_ansi_prefix(text: str) -> str:
-    return ANSI_PREFIX_RE.sub("", text)
+def _strip_ansi(text: str) -> str:
+    return ANSI_SGR_RE.sub("", text) if "\x1b" in text else text
 
 
 # ----------------------------- Log filtering ----------------------------------
@@ -180,181 +351,196 @@ class _LogLineFilter:
 # ----------------------------- Telemetry model --------------------------------
 
 
+def parse_telemetry_line(line: str) -> list[Tuple[str, Any]]:
+    """Parse one line into its (kind, value) records, in line order.
+
+    Each kind comes from its first occurrence on the line. Punch and flex
+    records move on to a later occurrence when one does not parse, the way a
+    PUNCH_RE/FLEX_RE search would skip e.g. a bare "FLEX:" log tag. A
+    bracketed payload that does not parse (say an unclosed "POS:[" running on
+    to a later "]") is rescanned, so records inside it are still found.
+
+    Kept free of TelemetryState so the per-line parsing has no attribute or
+    lock traffic and can be profiled or compiled on its own.
+    """
+    # Cheap literal gate: most lines are plain log chatter with no record.
+    # ":[" covers the FUSION/SFLP/POS/M payloads.
+    if ":[" not in line:
+        # PUNCH_RE/FLEX_RE are case-insensitive, so the cheap gate must be too.
+        lowered = line.lower()
+        if "punch detected" not in lowered and "flex:" not in lowered:
+            return []
+    records: list[Tuple[str, Any]] = []
+    done: set[str] = set()
+    pos = 0
+    while True:
+        match = TELEMETRY_RE.search(line, pos)
+        if match is None:
+            break
+        kind = match.lastgroup
+        if kind is None or kind in done:
+            # A repeated record's payload may still hold another record.
+            pos = match.start() + 1
+            continue
+        pos = match.end()
+        value: Any = None
+
+        if kind == "fusion" or kind == "sflp":
+            value = parse_quat(match.group(kind))
+            done.add(kind)
+
+        elif kind == "pos" or kind == "mag":
+            value = parse_vec3(match.group(kind))
+            done.add(kind)
+
+        elif kind == "punch":
+            value = parse_punch(line, match.start(), match.end())
+
+        elif kind == "flex":
+            value = parse_flex(line, match.start(), match.end())
+
+        if value is not None:
+            done.add(kind)
+            records.append((kind, value))
+        elif kind in done:
+            # Unparsed bracketed payload: rescan inside it.
+            pos = match.start() + 1
+    return records
+
+
+@dataclass(frozen=True, slots=True)
+class TelemetrySnapshot:
+    """Latest telemetry values; replaced wholesale on every update."""
+
+    fusion: Optional[Tuple[float, float, float, float]] = None
+    sflp: Optional[Tuple[float, float, float, float]] = None
+    active: Optional[Tuple[float, float, float, float]] = None
+    source: Optional[str] = None
+    position: Optional[Tuple[float, float, float]] = None
+    position_ts: float = 0.0
+    punch: Optional[Tuple[float, float, float]] = None
+    punch_ts: float = 0.0
+    mag: Optional[Tuple[float, float, float]] = None
+    mag_ts: float = 0.0
+    flex_value: Optional[int] = None
+    flex_raw: Optional[int] = None
+    flex_midi: Optional[int] = None
+    flex_ts: float = 0.0
+
+
 class TelemetryState:
     def __init__(self):
-        self._lock = threading.Lock()
-        self._latest_fusion: Optional[Tuple[float, float, float, float]] = None
-        self._latest_sflp: Optional[Tuple[float, float, float, float]] = None
-        self._latest_position: Optional[np.ndarray] = None
-        self._position_ts = 0.0
-        self._latest_mag: Optional[np.ndarray] = None
-        self._mag_ts = 0.0
+        # Single writer (ingest thread), single reader (GUI thread): each update
+        # publishes a new immutable snapshot with one reference store, which is
+        # atomic under the GIL, so readers never see a half-applied record.
+        self._state = TelemetrySnapshot()
         self._last_telemetry_update = 0.0
-        self._last_punch: Optional[Tuple[float, float, float]] = None
-        self._last_punch_ts = 0.0
-        self._flex_value = None
-        self._flex_raw_median = None
-        self._flex_midi = None
-        self._flex_ts = 0.0
+        self._wakeup: Optional[Callable[[], None]] = None
+        self._wakeup_armed = False
+
+    def set_wakeup(self, wakeup: Optional[Callable[[], None]]) -> None:
+        self._wakeup = wakeup
+
+    def arm_wakeup(self) -> None:
+        # The next published snapshot calls the wakeup once. Readers re-check
+        # snapshot() after arming, so a sample landing in between is not lost.
+        self._wakeup_armed = True
 
     def ingest_line(self, line: str) -> None:
-        updated = False
-        fusion_match = FUSION_Q_RE.search(line)
-        if fusion_match:
-            q = parse_quat(fusion_match.group(1))
-            if q:
-                with self._lock:
-                    self._latest_fusion = q
-                    self._last_telemetry_update = time.time()
-                updated = True
-
-        sflp_match = SFLP_Q_RE.search(line)
-        if sflp_match:
-            q = parse_quat(sflp_match.group(1))
-            if q:
-                with self._lock:
-                    self._latest_sflp = q
-                    self._last_telemetry_update = time.time()
-                updated = True
-
-        pos_match = POSITION_RE.search(line)
-        if pos_match:
-            pos = parse_vec3(pos_match.group(1))
-            if pos is not None:
-                arr = np.array(pos, dtype=float)
-                with self._lock:
-                    self._latest_position = arr
-                    self._position_ts = time.time()
-                    self._last_telemetry_update = self._position_ts
-                updated = True
-
-        mag_match = MAG_RE.search(line)
-        if mag_match:
-            mag = parse_vec3(mag_match.group(1))
-            if mag is not None:
-                arr = np.array(mag, dtype=float)
-                with self._lock:
-                    self._latest_mag = arr
-                    self._mag_ts = time.time()
-                    self._last_telemetry_update = self._mag_ts
-                updated = True
-
-        punch_match = PUNCH_RE.search(line)
-        if punch_match:
-            try:
-                velocity = float(punch_match.group(1))
-                horizontal = float(punch_match.group(2))
-                vertical = float(punch_match.group(3))
-            except ValueError:
-                velocity = float("nan")
-                horizontal = float("nan")
-                vertical = float("nan")
-
-            if np.isfinite(
-                np.array([velocity, horizontal, vertical], dtype=float)
-            ).all():
-                with self._lock:
-                    self._last_punch = (velocity, horizontal, vertical)
-                    self._last_punch_ts = time.time()
-                    self._last_telemetry_update = self._last_punch_ts
-                updated = True
-
-        flex_match = FLEX_RE.search(line)
-        if flex_match:
-            try:
-                _old = int(flex_match.group(1))
-                new_val = int(flex_match.group(2))
-                raw_median = int(flex_match.group(3))
-                midi_val = int(flex_match.group(4))
-            except ValueError:
-                new_val = None
-                raw_median = None
-                midi_val = None
-            if None not in (new_val, raw_median, midi_val):
-                with self._lock:
-                    self._flex_value = new_val
-                    self._flex_raw_median = raw_median
-                    self._flex_midi = midi_val
-                    self._flex_ts = time.time()
-                    self._last_telemetry_update = self._flex_ts
-                updated = True
-
-        if not updated:
-            with self._lock:
-                self._last_telemetry_update = time.time()
-
-    def snapshot(
-        self,
-    ) -> tuple[
-        Optional[Tuple[float, float, float, float]],
-        Optional[Tuple[float, float, float, float]],
-        Optional[Tuple[float, float, float, float]],
-        Optional[str],
-        Optional[np.ndarray],
-        float,
-        Optional[Tuple[float, float, float]],
-        float,
-        Optional[np.ndarray],
-        float,
-        Optional[int],
-        Optional[int],
-        Optional[int],
-        float,
-    ]:
-        with self._lock:
-            fusion = self._latest_fusion
-            sflp = self._latest_sflp
-            position = (
-                None
-                if self._latest_position is None
-                else np.array(self._latest_position, copy=True)
-            )
-            ts = self._position_ts
-            active = fusion if fusion is not None else sflp
-            source = None
-            if active is fusion and fusion is not None:
-                source = "fusion"
-            elif active is sflp and sflp is not None:
-                source = "sflp"
-            punch = self._last_punch
-            punch_ts = self._last_punch_ts
-            mag = (
-                None
-                if self._latest_mag is None
-                else np.array(self._latest_mag, copy=True)
-            )
-            mag_ts = self._mag_ts
-            flex_value = self._flex_value
-            flex_raw = self._flex_raw_median
-            flex_midi = self._flex_midi
-            flex_ts = self._flex_ts
-        return (
-            fusion,
-            sflp,
-            active,
-            source,
-            position,
-            ts,
-            punch,
-            punch_ts,
-            mag,
-            mag_ts,
-            flex_value,
-            flex_raw,
-            flex_midi,
-            flex_ts,
-        )
+        records = parse_telemetry_line(line)
+        now = time.time()
+        self._last_telemetry_update = now
+        if not records:
+            return
+
+        state = self._state
+        for kind, value in records:
+            if kind == "fusion":
+                state = replace(state, fusion=value, active=value, source="fusion")
+            elif kind == "sflp":
+                if state.fusion is None:
+                    state = replace(state, sflp=value, active=value, source="sflp")
+                else:
+                    state = replace(state, sflp=value)
+            elif kind == "pos":
+                state = replace(state, position=value, position_ts=now)
+            elif kind == "mag":
+                state = replace(state, mag=value, mag_ts=now)
+            elif kind == "punch":
+                state = replace(state, punch=value, punch_ts=now)
+            elif kind == "flex":
+                flex_value, flex_raw, flex_midi = value
+                state = replace(
+                    state,
+                    flex_value=flex_value,
+                    flex_raw=flex_raw,
+                    flex_midi=flex_midi,
+                    flex_ts=now,
+                )
+        # One publish per line, however many records it carried.
+        self._state = state
+        if self._wakeup_armed and self._wakeup is not None:
+            self._wakeup_armed = False
+            self._wakeup()
+
+    def snapshot(self) -> TelemetrySnapshot:
+        return self._state
 
 
 # ----------------------------- Dispatcher and buffer --------------------------
 
 
+_T = TypeVar("_T")
+
+
+class UiQueue(Generic[_T]):
+    """Worker-to-GUI FIFO that wakes the consumer instead of being polled.
+
+    The wakeup callback fires once per batch: after it runs, further puts stay
+    silent until the consumer calls drain(). This keeps event-loop traffic
+    bounded no matter how fast producers push items. A drain takes at most
+    MAX_DRAIN items; anything beyond that schedules another wakeup so a burst
+    is spread over several event-loop turns.
+    """
+
+    def __init__(self) -> None:
+        self._items: "deque[_T]" = deque()
+        self._lock = threading.Lock()
+        self._wakeup: Optional[Callable[[], None]] = None
+        self._wakeup_pending = False
+
+    def set_wakeup(self, wakeup: Optional[Callable[[], None]]) -> None:
+        self._wakeup = wakeup
+
+    def put(self, item: _T) -> None:
+        with self._lock:
+            self._items.append(item)
+            if self._wakeup_pending or self._wakeup is None:
+                return
+            self._wakeup_pending = True
+        self._wakeup()
+
+    def drain(self) -> list[_T]:
+        # One lock round-trip per drain, however many items are waiting.
+        with self._lock:
+            if len(self._items) <= MAX_DRAIN:
+                items = list(self._items)
+                self._items.clear()
+                self._wakeup_pending = False
+                return items
+            items = [self._items.popleft() for _ in range(MAX_DRAIN)]
+        # Still pending: wake the consumer again for the remainder.
+        if self._wakeup is not None:
+            self._wakeup()
+        return items
+
+
 class LineDispatcher:
     def __init__(
         self,
         telemetry: TelemetryState,
-        cli_queue: "queue.Queue[str]",
-        monitor_queue: "queue.Queue[str]",
+        cli_queue: "UiQueue[str]",
+        monitor_queue: "UiQueue[str]",
         log_filter: _LogLineFilter,
     ):
         self._telemetry = telemetry
@@ -364,29 +550,37 @@ class LineDispatcher:
         self._pending_cli: list[str] = []
 
     def handle_line(self, line: str) -> None:
-        stripped = line.rstrip("\r\n")
+        # Color codes are dropped once per line; nothing downstream (telemetry,
+        # segmenting, either pane) needs them.
+        stripped = _strip_ansi(line.rstrip("\r\n"))
         if not stripped:
             return
         self._telemetry.ingest_line(stripped)
-        segments = self._split_line(stripped)
-        self._emit_segments(segments)
-        self._maybe_flush_cli(segments, force=False)
+        self._dispatch(self._split_line(stripped), force=False)
 
     def flush_fragment(self, fragment: str) -> None:
-        frag = fragment.rstrip("\r\n")
+        frag = _strip_ansi(fragment.rstrip("\r\n"))
         if not frag:
             return
-        segments = self._split_line(frag)
-        self._emit_segments(segments)
-        self._maybe_flush_cli(segments, force=True)
-
-    def _emit_segments(self, segments: list[tuple[str, str]]) -> None:
+        self._dispatch(self._split_line(frag), force=True)
+
+    def _dispatch(self, segments: list[tuple[str, str]], force: bool) -> None:
+        # Everything bound for the CLI pane from one line goes out as a single
+        # queue item.
+        cli_out: list[str] = []
+        self._emit_segments(segments, cli_out)
+        self._maybe_flush_cli(segments, force, cli_out)
+        if cli_out:
+            self._cli_queue.put("".join(cli_out))
+
+    def _emit_segments(
+        self, segments: list[tuple[str, str]], cli_out: list[str]
+    ) -> None:
         for text, kind in segments:
             if not text:
                 continue
             if kind == "log":
-                plain_log = _strip_ansi_prefix(text)
-                match = LOG_LINE_RE.match(plain_log)
+                match = LOG_LINE_RE.match(text)
                 if match is None:
                     self._pending_cli.append(text)
                     continue
@@ -394,59 +588,44 @@ class LineDispatcher:
                 if tag not in SUPPRESSED_MONITOR_TAGS:
                     self._monitor_queue.put(text)
                 if self._log_filter.allows(match):
-                    self._cli_queue.put(text + "\n")
+                    cli_out.append(text + "\n")
             else:
                 self._pending_cli.append(text)
 
-    def _maybe_flush_cli(self, segments: list[tuple[str, str]], force: bool) -> None:
+    def _maybe_flush_cli(
+        self, segments: list[tuple[str, str]], force: bool, cli_out: list[str]
+    ) -> None:
         if not self._pending_cli:
             return
         last_kind = segments[-1][1] if segments else None
         should_flush = force or last_kind == "cli"
         if not should_flush:
             return
-        payload = "".join(self._pending_cli)
+        cli_out.extend(self._pending_cli)
         if not force:
-            payload += "\n"
-        self._cli_queue.put(payload)
+            cli_out.append("\n")
         self._pending_cli.clear()
 
     def _split_line(self, text: str) -> list[tuple[str, str]]:
         segments: list[tuple[str, str]] = []
-        if not text:
-            return segments
-        ansi_match = ANSI_PREFIX_RE.match(text)
-        prefix_len = ansi_match.end() if ansi_match else 0
-        if prefix_len:
-            segments.append((text[:prefix_len], "cli"))
-        plain = text[prefix_len:]
         cursor = 0
-        length = len(plain)
+        length = len(text)
         while cursor < length:
-            indices = [plain.find(prefix, cursor) for prefix in LOG_PREFIXES]
-            indices = [idx for idx in indices if idx != -1]
-            if not indices:
-                remainder = plain[cursor:]
-                if remainder:
-                    segments.append(
-                        (text[prefix_len + cursor : prefix_len + length], "cli")
-                    )
+            prefix_match = LOG_PREFIX_RE.search(text, cursor)
+            if prefix_match is None:
+                segments.append((text[cursor:], "cli"))
                 break
-            idx = min(indices)
-            candidate = plain[idx:]
-            match = LOG_LINE_RE.match(candidate)
+            idx = prefix_match.start()
+            match = LOG_LINE_RE.match(text[idx:])
             if match is None:
                 cursor = idx + 1
                 continue
             if idx > cursor:
-                cli_slice = text[prefix_len + cursor : prefix_len + idx]
-                if cli_slice:
-                    segments.append((cli_slice, "cli"))
+                segments.append((text[cursor:idx], "cli"))
             log_len = match.end()
             if log_len <= 0:
                 break
-            log_slice = text[prefix_len + idx : prefix_len + idx + log_len]
-            segments.append((log_slice, "log"))
+            segments.append((text[idx : idx + log_len], "log"))
             cursor = idx + log_len
         return segments
 
@@ -459,38 +638,17 @@ class LineBuffer:
         self._handle_line = handle_line
         self._flush_fragment = flush_fragment
 
-    @staticmethod
-    def _next_newline_index(buffer: str) -> Optional[int]:
-        if not buffer:
-            return None
-        positions = [idx for idx in (buffer.find("\n"), buffer.find("\r")) if idx != -1]
-        if not positions:
-            return None
-        return min(positions)
-
-    @staticmethod
-    def _consume_newline(buffer: str, newline_index: int) -> int:
-        consume = newline_index + 1
-        if (
-            buffer[newline_index] == "\r"
-            and consume < len(buffer)
-            and buffer[consume] == "\n"
-        ):
-            consume += 1
-        return consume
-
     def feed(self, chunk: str) -> None:
         if not chunk:
             return
-        self._buffer += chunk
-        while True:
-            newline_idx = self._next_newline_index(self._buffer)
-            if newline_idx is None:
-                break
-            consume = self._consume_newline(self._buffer, newline_idx)
-            line = self._buffer[:newline_idx]
-            self._buffer = self._buffer[consume:]
-            self._handle_line(line)
+        buffer = self._buffer + chunk
+        # Walk a cursor over the buffer instead of re-slicing the tail after
+        # every line; the remainder is copied once per chunk.
+        start = 0
+        for newline in NEWLINE_RE.finditer(buffer):
+            self._handle_line(buffer[start : newline.start()])
+            start = newline.end()
+        self._buffer = buffer[start:]
         if self._buffer and len(self._buffer) > 256:
             self._flush_fragment(self._buffer)
             self._buffer = ""
@@ -510,15 +668,17 @@ class SerialTelemetryClient(threading.Thread):
         port: str,
         baud: int,
         dispatcher: LineDispatcher,
-        status_queue: "queue.Queue[str]",
+        status_queue: "UiQueue[StatusItem]",
     ):
         super().__init__(daemon=True)
         self._port = port
         self._baud = baud
         self._dispatcher = dispatcher
         self._status_queue = status_queue
-        self._stop = threading.Event()
+        self._stop_event = threading.Event()
         self._serial = None
+        # Incremental so a UTF-8 sequence split across reads is not dropped.
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
         self._buffer = LineBuffer(
             self._dispatcher.handle_line, self._dispatcher.flush_fragment
         )
@@ -535,7 +695,7 @@ class SerialTelemetryClient(threading.Thread):
             raise RuntimeError("pyserial is required for UART mode") from exc
 
     def stop(self) -> None:
-        self._stop.set()
+        self._stop_event.set()
         if self._serial and getattr(self._serial, "cancel_read", None):
             try:
                 self._serial.cancel_read()
@@ -547,30 +707,34 @@ class SerialTelemetryClient(threading.Thread):
     def send_text(self, text: str) -> None:
         if not text or not self._serial or not self._serial.is_open:
             return
-        normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-        if not normalized.endswith("\n"):
-            normalized += "\n"
-        payload = normalized.replace("\n", "\r\n")
         try:
-            self._serial.write(payload.encode("utf-8"))
+            self._serial.write(_encode_crlf(text))
         except Exception:
             pass
 
-    def run(self) -> None:  # pragma: no cover
+    def _port_present(self) -> bool:
+        # On POSIX the port is a device node, so one stat() answers this;
+        # comports() rescans every serial device in sysfs on each retry.
+        if os.name == "posix" and self._port.startswith("/dev/"):
+            return os.path.exists(self._port)
         import serial.tools.list_ports
 
+        return any(
+            p.device == self._port for p in serial.tools.list_ports.comports()
+        )
+
+    def run(self) -> None:  # pragma: no cover
         connected = False
         reconnect_attempt = 0
 
-        while not self._stop.is_set():
+        while not self._stop_event.is_set():
             # Try to connect/reconnect
             if not connected:
                 try:
                     # Check if port exists before attempting connection
-                    available_ports = [p.device for p in serial.tools.list_ports.comports()]
-                    if self._port not in available_ports:
+                    if not self._port_present():
                         if reconnect_attempt == 0:
-                            self._status_queue.put(f"Serial waiting for device on {self._port}...")
+                            self._status_queue.put(("serial_waiting", self._port))
                         reconnect_attempt += 1
                         time.sleep(1.5)
                         continue
@@ -578,24 +742,25 @@ class SerialTelemetryClient(threading.Thread):
                     self._serial = self._serial_mod.Serial(self._port, self._baud, timeout=1)
                     connected = True
                     reconnect_attempt = 0
-                    self._status_queue.put(f"Serial connected: {self._port} @ {self._baud}")
+                    self._status_queue.put(("serial_connected", self._port, self._baud))
                 except Exception as exc:
                     if reconnect_attempt == 0:
-                        self._status_queue.put(f"Serial connection failed: {exc}, retrying...")
+                        self._status_queue.put(("serial_failed", exc))
                     reconnect_attempt += 1
                     time.sleep(1.5)
                     continue
 
             # Read data while connected
             try:
-                raw = self._serial.readline()
+                # Drain whatever the driver has buffered in one call; block for
+                # at most the port timeout when idle. LineBuffer does framing.
+                raw = self._serial.read(self._serial.in_waiting or 1)
                 if not raw:
                     continue
-                text = raw.decode(errors="ignore")
-                self._buffer.feed(text)
+                self._buffer.feed(self._decoder.decode(raw))
             except Exception as exc:
                 # Connection lost - close and retry
-                self._status_queue.put(f"Serial disconnected, reconnecting: {exc}")
+                self._status_queue.put(("serial_lost", exc))
                 try:
                     if self._serial:
                         self._serial.close()
@@ -603,6 +768,7 @@ class SerialTelemetryClient(threading.Thread):
                     # Ignore close errors to keep shutdown robust
                     pass
                 self._serial = None
+                self._decoder.reset()
                 connected = False
                 reconnect_attempt = 0
                 continue
@@ -617,7 +783,7 @@ class SerialTelemetryClient(threading.Thread):
                 except Exception:  # pragma: no cover
                     # Ignore close errors to keep shutdown robust
                     pass
-            self._status_queue.put("Serial disconnected")
+            self._status_queue.put(("serial_closed",))
 
 
 class BleTelemetryClient:
@@ -628,7 +794,8 @@ class BleTelemetryClient:
         scan_time: float,
         timeout: float,
         dispatcher: LineDispatcher,
-        status_queue: "queue.Queue[str]",
+        status_queue: "UiQueue[StatusItem]",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
         self._name_hint = name_hint
         self._address = address
@@ -636,7 +803,8 @@ class BleTelemetryClient:
         self._timeout = timeout
         self._dispatcher = dispatcher
         self._status_queue = status_queue
-        self._loop = asyncio.new_event_loop()
+        # The client thread owns the loop from start() on and closes it.
+        self._loop = loop if loop is not None else asyncio.new_event_loop()
         self._thread = threading.Thread(target=self._thread_main, daemon=True)
         self._commands: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
         self._stop_event = asyncio.Event()
@@ -663,10 +831,7 @@ class BleTelemetryClient:
     def send_text(self, text: str) -> None:
         if not text:
             return
-        normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-        if not normalized.endswith("\n"):
-            normalized += "\n"
-        encoded = normalized.replace("\n", "\r\n").encode("utf-8")
+        encoded = _encode_crlf(text)
 
         def _enqueue() -> None:
             if not self._commands.full():
@@ -686,20 +851,18 @@ class BleTelemetryClient:
             self._loop.close()
 
     async def _run(self) -> None:
-        try:
-            from bleak import BleakClient, BleakScanner
-        except Exception as exc:
-            self._status_queue.put(f"BLE unavailable: {exc}")
+        bleak, exc = _load_bleak()
+        if bleak is None:
+            self._status_queue.put(("ble_unavailable", exc))
             return
+        BleakClient, BleakScanner = bleak.BleakClient, bleak.BleakScanner
 
         async def _resolve_target() -> Optional[str]:
             if self._address:
-                self._status_queue.put(f"BLE: connecting to {self._address} ...")
+                self._status_queue.put(("ble_connecting", self._address))
                 return self._address
             hint = (self._name_hint or BLE_DEFAULT_NAME_HINT).lower()
-            self._status_queue.put(
-                f"BLE: scanning for devices matching '{hint}' ({self._scan_time:.1f}s timeout)"
-            )
+            self._status_queue.put(("ble_scanning", hint, self._scan_time))
 
             def _matches(device, adv_data):
                 name = (device.name or "").lower()
@@ -712,7 +875,7 @@ class BleTelemetryClient:
             if not device:
                 return None
             self._status_queue.put(
-                f"BLE: found {device.name or 'Unnamed'} ({device.address}). Connecting..."
+                ("ble_found", device.name or "Unnamed", device.address)
             )
             return device.address
 
@@ -721,9 +884,7 @@ class BleTelemetryClient:
             target = await _resolve_target()
             if not target:
                 if reconnect_attempt == 0:
-                    self._status_queue.put(
-                        "BLE: device not found, retrying scan..."
-                    )
+                    self._status_queue.put(("ble_rescan",))
                 reconnect_attempt += 1
                 await asyncio.sleep(2.0)
                 continue
@@ -738,23 +899,46 @@ class BleTelemetryClient:
                     self._client = client
 
                     await client.start_notify(NUS_TX_CHAR_UUID, self._handle_notify)
-                    self._status_queue.put("BLE connected. Receiving notifications...")
+                    self._status_queue.put(("ble_connected",))
                     reconnect_attempt = 0
 
-                    while not self._stop_event.is_set() and not disconnected_event.is_set():
-                        try:
-                            payload = await asyncio.wait_for(
-                                self._commands.get(), timeout=0.1
+                    # Sleep until a command, a stop request or a disconnect
+                    # arrives; nothing wakes the loop while the link is idle.
+                    stop_wait = asyncio.create_task(self._stop_event.wait())
+                    disconnect_wait = asyncio.create_task(disconnected_event.wait())
+                    command_wait: Optional[asyncio.Task] = None
+                    try:
+                        while True:
+                            command_wait = asyncio.create_task(self._commands.get())
+                            done, _ = await asyncio.wait(
+                                {command_wait, stop_wait, disconnect_wait},
+                                return_when=asyncio.FIRST_COMPLETED,
                             )
-                        except asyncio.TimeoutError:
-                            continue
-                        if payload is None:
-                            break
-                        await _write_nus(client, payload)
+                            if command_wait not in done:
+                                break
+                            payload = command_wait.result()
+                            if payload is None:
+                                break
+                            # Coalesce commands queued meanwhile so one
+                            # MTU-sized write can carry several of them.
+                            stop_requested = False
+                            while not self._commands.empty():
+                                pending = self._commands.get_nowait()
+                                if pending is None:
+                                    stop_requested = True
+                                    break
+                                payload += pending
+                            await _write_nus(client, payload)
+                            if stop_requested:
+                                break
+                    finally:
+                        for waiter in (command_wait, stop_wait, disconnect_wait):
+                            if waiter is not None:
+                                waiter.cancel()
 
                     # Check if we exited due to disconnection
                     if disconnected_event.is_set():
-                        self._status_queue.put("BLE disconnected, reconnecting...")
+                        self._status_queue.put(("ble_lost",))
                         reconnect_attempt += 1
                         await asyncio.sleep(2.0)
                         continue
@@ -762,19 +946,18 @@ class BleTelemetryClient:
                     await client.stop_notify(NUS_TX_CHAR_UUID)
                     break  # Clean exit requested
             except Exception as exc:
-                error_msg = str(exc)
                 if reconnect_attempt == 0:
-                    self._status_queue.put(f"BLE connection error: {error_msg}, reconnecting...")
+                    self._status_queue.put(("ble_error", exc))
                 else:
                     # Show error periodically (every 5 attempts)
                     if reconnect_attempt % 5 == 0:
-                        self._status_queue.put(f"BLE reconnect attempt {reconnect_attempt} failed: {error_msg}")
+                        self._status_queue.put(("ble_retry_failed", reconnect_attempt, exc))
                 reconnect_attempt += 1
                 await asyncio.sleep(2.0)
                 continue
 
         self._buffer.flush()
-        self._status_queue.put("BLE disconnected")
+        self._status_queue.put(("ble_closed",))
 
     def _handle_notify(self, _characteristic: object, data: bytearray) -> None:
         try:
@@ -807,14 +990,44 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.patches import Circle
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 if TYPE_CHECKING:
     from mpl_toolkits.mplot3d.axes3d import Axes3D
-    from mpl_toolkits.mplot3d.art3d import Line3D, Path3DCollection
+    from mpl_toolkits.mplot3d.art3d import Line3D
+    from matplotlib.artist import Artist
     from matplotlib.axes import Axes
     from matplotlib.lines import Line2D
 
 
+@functools.lru_cache(maxsize=4)
+def _unit_sphere_lines(rows: int, cols: int) -> np.ndarray:
+    # `rows` parallels and `cols` meridians of a unit sphere as one
+    # (rows + cols, cols, 3) float32 array, computed once per grid size and
+    # shared between windows (hence read-only). Meridians are sampled at
+    # `cols` points too so every polyline has the same length; Line3DCollection
+    # then projects the block as-is instead of concatenating and re-splitting
+    # ragged lines on every draw.
+    phi = np.linspace(0.0, np.pi, rows, dtype=np.float32)
+    theta = np.linspace(0.0, 2.0 * np.pi, cols, dtype=np.float32)
+    meridian_phi = np.linspace(0.0, np.pi, cols, dtype=np.float32)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
+    lines = np.empty((rows + cols, cols, 3), dtype=np.float32)
+    sin_phi = np.sin(phi)[:, None]
+    lines[:rows, :, 0] = sin_phi * cos_theta
+    lines[:rows, :, 1] = sin_phi * sin_theta
+    lines[:rows, :, 2] = np.cos(phi)[:, None]
+    sin_meridian = np.sin(meridian_phi)
+    lines[rows:, :, 0] = cos_theta[:, None] * sin_meridian
+    lines[rows:, :, 1] = sin_theta[:, None] * sin_meridian
+    lines[rows:, :, 2] = np.cos(meridian_phi)
+    lines.setflags(write=False)
+    return lines
+
+
 class PillSplitterHandle(QtWidgets.QSplitterHandle):
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
@@ -844,6 +1057,9 @@ class PillSplitter(QtWidgets.QSplitter):
 
 
 class DashboardWindow(QtWidgets.QMainWindow):
+    queues_ready = QtCore.Signal()
+    telemetry_ready = QtCore.Signal()
+
     def __init__(self, args: argparse.Namespace):
         super().__init__()
         self.args = args
@@ -857,9 +1073,22 @@ class DashboardWindow(QtWidgets.QMainWindow):
             }
 
         self.telemetry = TelemetryState()
-        self.cli_queue: "queue.Queue[str]" = queue.Queue()
-        self.monitor_queue: "queue.Queue[str]" = queue.Queue()
-        self.status_queue: "queue.Queue[str]" = queue.Queue()
+        self.cli_queue: "UiQueue[str]" = UiQueue()
+        self.monitor_queue: "UiQueue[str]" = UiQueue()
+        self.status_queue: "UiQueue[StatusItem]" = UiQueue()
+        # Worker threads emit; the queued connection runs _poll_queues on the
+        # GUI thread, so the queues are drained only when something arrived.
+        self.queues_ready.connect(
+            self._poll_queues, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+        for ui_queue in (self.cli_queue, self.monitor_queue, self.status_queue):
+            ui_queue.set_wakeup(self.queues_ready.emit)
+        # The plot timer stops while nothing changes and is restarted by the
+        # first new sample.
+        self.telemetry_ready.connect(
+            self._resume_plot_timer, QtCore.Qt.ConnectionType.QueuedConnection
+        )
+        self.telemetry.set_wakeup(self.telemetry_ready.emit)
         self.log_filter = _LogLineFilter(args.show_logs, allowed_tags)
         self.dispatcher = LineDispatcher(
             self.telemetry, self.cli_queue, self.monitor_queue, self.log_filter
@@ -874,40 +1103,63 @@ class DashboardWindow(QtWidgets.QMainWindow):
         self.info_battery = "--"
         self.info_voltage: Optional[str] = None
         self.info_rssi = "--"
+        self._battery_segment = "Battery: --"
+        self._rssi_segment = "RSSI: --"
         self.orientation_source = "Waiting"
         self.punch_display_duration = 2.0
         self.punch_velocity_full_scale = 6.0
+        # Reciprocal full scales; 0.0 means scaling is disabled.
+        self._inv_punch_full_scale = _reciprocal(self.punch_velocity_full_scale)
         self.flex_meter_full_scale = 127.0
         self.flex_meter_stale_timeout = 2.5
         self.flex_bar = None
         self.flex_value_label = None
 
-        base_vec = np.array(args.vector, dtype=float)
-        if np.linalg.norm(base_vec) == 0:
-            base_vec = np.array([0.0, 0.0, 1.0])
-        self.base_vec = base_vec / np.linalg.norm(base_vec)
+        # Plain floats: the per-frame rotation is scalar code, and indexing an
+        # array would hand back NumPy scalars.
+        bx, by, bz = (float(c) for c in args.vector)
+        norm = math.hypot(bx, by, bz)
+        if norm == 0.0:
+            bx, by, bz, norm = 0.0, 0.0, 1.0, 1.0
+        self.base_vec: Tuple[float, float, float] = (bx / norm, by / norm, bz / norm)
 
         self._build_ui()
         self._load_splitter_state()
 
         # Plot state
-        self.position_trail: deque[np.ndarray] = deque(maxlen=300)
+        # Trail ring buffer, one contiguous row per axis. Each sample is
+        # written twice (slot and slot + length) so the newest `count`
+        # samples are always a contiguous, chronological view.
+        self.trail_length = 300
+        self._trail = np.zeros((3, 2 * self.trail_length), dtype=float)
+        self._trail_head = 0
+        self._trail_count = 0
+        # Largest |coordinate| in the trail, kept up to date by _append_trail.
+        self._trail_extent = 0.0
         self.last_position_ts = 0.0
         self._last_trail_radius = 1.5
         self.orientation_radius = 1.0
+        self._shown_active: Optional[Tuple[float, float, float, float]] = None
+        # Inputs the punch, compass and flex artists currently show; None is
+        # the hidden/cleared state they are created in.
+        self._shown_punch: Optional[Tuple[float, float, float]] = None
+        self._shown_mag: Optional[Tuple[float, float, float]] = None
+        self._shown_flex: Optional[Tuple[Optional[int], Optional[int], int]] = None
         self.compass_full_scale = 60.0
+        self._inv_compass_full_scale = _reciprocal(self.compass_full_scale)
         self.compass_max_radius = 0.85
+        self.compass_stale_timeout = 3.0
+        # Last snapshot drawn and the time its next timeout fires; until
+        # either changes a plot tick has nothing to do.
+        self._drawn_snapshot: Optional[TelemetrySnapshot] = None
+        self._redraw_deadline = 0.0
 
         # Start transport
         self.client = self._start_transport()
 
         # Timers
-        self.queue_timer = QtCore.QTimer(self)
-        self.queue_timer.setInterval(25)
-        self.queue_timer.timeout.connect(self._poll_queues)
-        self.queue_timer.start()
-
         self.plot_timer = QtCore.QTimer(self)
+        self.plot_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self.plot_timer.setInterval(33)  # ~30 Hz
         self.plot_timer.timeout.connect(self._update_plot)
         self.plot_timer.start()
@@ -917,8 +1169,9 @@ class DashboardWindow(QtWidgets.QMainWindow):
 
     # ------------------------- UI layout --------------------------------------
 
-    def _create_monospace_font(self) -> QtGui.QFont:
-        """Create a monospaced font with consistent styling."""
+    @functools.cached_property
+    def _monospace_font(self) -> QtGui.QFont:
+        """Monospaced font with consistent styling, built once per window."""
         font = QtGui.QFont()
         font.setStyleHint(QtGui.QFont.StyleHint.Monospace)
         font.setFamily(
@@ -968,6 +1221,10 @@ class DashboardWindow(QtWidgets.QMainWindow):
 
         self.status_label = QtWidgets.QLabel("Connecting...")
         self.info_label = QtWidgets.QLabel("")
+        # Last texts pushed to the labels, so unchanged updates skip setText.
+        self._status_text = "Connecting..."
+        self._info_text = ""
+        self._info_dirty = False
         self.status_label.setWordWrap(True)
         self.info_label.setWordWrap(True)
         right_layout.addWidget(self.status_label)
@@ -996,15 +1253,16 @@ class DashboardWindow(QtWidgets.QMainWindow):
             QtWidgets.QPlainTextEdit.LineWrapMode.NoWrap
         )
         self.cli_text.document().setMaximumBlockCount(5000)
+        self._cli_cursor = QtGui.QTextCursor(self.cli_text.document())
         # Set monospaced font for CLI console
-        self.cli_text.setFont(self._create_monospace_font())
+        self.cli_text.setFont(self._monospace_font)
         cli_layout.addWidget(self.cli_text, 1)
 
         self.cli_input = QtWidgets.QPlainTextEdit()
         self.cli_input.setFixedHeight(90)
         self.cli_input.installEventFilter(self)
         # Set monospaced font for command input
-        self.cli_input.setFont(self._create_monospace_font())
+        self.cli_input.setFont(self._monospace_font)
 
         cmd_input_header = QtWidgets.QHBoxLayout()
         cmd_input_title = QtWidgets.QLabel("Command Input")
@@ -1035,7 +1293,7 @@ class DashboardWindow(QtWidgets.QMainWindow):
         )
         self.monitor_text.document().setMaximumBlockCount(5000)
         # Set monospaced font for monitor logs
-        self.monitor_text.setFont(self._create_monospace_font())
+        self.monitor_text.setFont(self._monospace_font)
         mon_layout.addWidget(self.monitor_text, 1)
 
         inner_split.addWidget(cli_container)
@@ -1048,9 +1306,10 @@ class DashboardWindow(QtWidgets.QMainWindow):
         root_split.setStretchFactor(1, 3)
 
         # Axes setup
+        self._orientation_title = f"Active orientation ({self.orientation_source})"
         self._setup_axes(
             self.ax_orientation,
-            f"Active orientation ({self.orientation_source})",
+            self._orientation_title,
             hide_cartesian=True,
         )
         self._setup_axes(self.ax_position, "Position estimate (m)")
@@ -1068,14 +1327,17 @@ class DashboardWindow(QtWidgets.QMainWindow):
         self.ax_position.set_ylim([-1.5, 1.5])
         self.ax_position.set_zlim([-1.5, 1.5])
 
-        # Orientation primitives
-        pointer_origin = self.base_vec.copy()
+        # Orientation primitives. Line3D keeps references to the arrays given
+        # to set_data_3d, so these (3, n) x/y/z buffers are written in place
+        # each frame and handed back without building new lists.
+        self._pointer_xyz = np.zeros((3, 2))
+        self._pointer_xyz[:, 1] = self.base_vec
+        self._marker_xyz = self._pointer_xyz[:, 1:]
+        self._punch_xyz = np.zeros((3, 2))
         self.active_pointer_line = cast(
             "Line3D",
             self.ax_orientation.plot(
-                [0, pointer_origin[0]],
-                [0, pointer_origin[1]],
-                [0, pointer_origin[2]],
+                *self._pointer_xyz,
                 color="#1E90FF",
                 linewidth=3,
             )[0],
@@ -1083,24 +1345,23 @@ class DashboardWindow(QtWidgets.QMainWindow):
         self.punch_line = cast(
             "Line3D",
             self.ax_orientation.plot(
-                [0.0, 0.0],
-                [0.0, 0.0],
-                [0.0, 0.0],
+                *self._punch_xyz,
                 color="#FF1493",
                 linewidth=2.5,
-                alpha=0.0,
+                alpha=0.9,
             )[0],
         )
+        # Visibility alone shows or hides the punch; its alpha never changes.
         self.punch_line.set_visible(False)
         self.active_marker = cast(
-            "Path3DCollection",
-            cast(Any, self.ax_orientation).scatter(
-                [pointer_origin[0]],
-                [pointer_origin[1]],
-                zs=[pointer_origin[2]],
-                s=80,
+            "Line3D",
+            self.ax_orientation.plot(
+                *self._marker_xyz,
+                marker="o",
+                markersize=9,
+                linestyle="none",
                 color="#1E90FF",
-            ),
+            )[0],
         )
         self.active_angles_label = self.ax_orientation.text2D(
             0.02,
@@ -1108,12 +1369,11 @@ class DashboardWindow(QtWidgets.QMainWindow):
             "Roll: +0.0 deg, Pitch: +0.0 deg, Yaw: +0.0 deg",
             transform=self.ax_orientation.transAxes,
         )
-
         # Position primitives
         self.position_point = cast(
             "Line3D",
             self.ax_position.plot(
-                [0], [0], [0], marker="o", markersize=9, color="orange"
+                [0.0], [0.0], [0.0], marker="o", markersize=9, color="orange"
             )[0],
         )
         self.trail_line = cast(
@@ -1126,6 +1386,40 @@ class DashboardWindow(QtWidgets.QMainWindow):
             0.02, 0.95, "Pos: (0.00, 0.00, 0.00)", transform=self.ax_position.transAxes
         )
 
+        # Live artists are animated so full draws skip them; _update_plot
+        # repaints them over cached backgrounds, one band per grid row, and
+        # only for rows whose artists changed.
+        assert self.flex_bar is not None and self.flex_value_label is not None
+        self._blit_groups: tuple[tuple[tuple[Axes, ...], tuple[Artist, ...]], ...] = (
+            (
+                (self.ax_orientation,),
+                (
+                    self.active_pointer_line,
+                    self.punch_line,
+                    self.active_marker,
+                    self.active_angles_label,
+                ),
+            ),
+            (
+                (self.ax_position, self.ax_compass),
+                (
+                    self.position_point,
+                    self.trail_line,
+                    self.position_label,
+                    self.compass_line,
+                    self.compass_marker,
+                    self.compass_heading_label,
+                    self.compass_field_label,
+                ),
+            ),
+            ((self.ax_flex,), (self.flex_bar, self.flex_value_label)),
+        )
+        for _axes, artists in self._blit_groups:
+            for artist in artists:
+                artist.set_animated(True)
+        self._blit_regions: Optional[list[Tuple[Bbox, Any, tuple]]] = None
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
         # Status bar content
         self._refresh_info_bar()
 
@@ -1135,21 +1429,15 @@ class DashboardWindow(QtWidgets.QMainWindow):
     # Persist/restore splitter widths
     def _load_splitter_state(self) -> None:
         try:
-            data = json.loads(LAYOUT_STATE_FILE.read_text(encoding="utf-8"))
-            geo = data.get("geometry")
-            if isinstance(geo, str):
-                restored_bytes = base64.b64decode(geo.encode("ascii"))
-                if restored_bytes:
-                    self.restoreGeometry(QtCore.QByteArray(restored_bytes))
+            restored_bytes = LAYOUT_STATE_FILE.read_bytes()
+            if restored_bytes:
+                self.restoreGeometry(QtCore.QByteArray(restored_bytes))
         except Exception:
             pass
 
     def _save_splitter_state(self) -> None:
         try:
-            geometry_bytes = bytes(self.saveGeometry().data())
-            geometry = base64.b64encode(geometry_bytes).decode("ascii")
-            payload = {"geometry": geometry}
-            LAYOUT_STATE_FILE.write_text(json.dumps(payload), encoding="utf-8")
+            LAYOUT_STATE_FILE.write_bytes(self.saveGeometry().data())
         except Exception:
             pass
 
@@ -1220,11 +1508,11 @@ class DashboardWindow(QtWidgets.QMainWindow):
         # JSON pretty-minifier while appending
         payload = text
         # Simple pass-through; pretty-JSON is handled in batch appender below
-        self.cli_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
-        self.cli_text.insertPlainText(
-            payload + ("\n" if not payload.endswith("\n") else "")
+        self._append_plain_text(
+            self.cli_text,
+            self._cli_cursor,
+            payload + ("\n" if not payload.endswith("\n") else ""),
         )
-        self.cli_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
 
     def _append_cli_output_batch(self, lines: list[str]) -> None:
         if not lines:
@@ -1232,106 +1520,107 @@ class DashboardWindow(QtWidgets.QMainWindow):
         payload = "".join(lines)
         if not payload:
             return
-        # Convert embedded JSON objects into pretty form
+        # Convert embedded JSON objects into pretty form. raw_decode parses
+        # from each "{" in C and handles braces inside strings; text that is
+        # not valid JSON passes through unchanged.
         out = []
-        buf = ""
-        in_json = False
-        depth = 0
-        i = 0
-        while i < len(payload):
-            ch = payload[i]
-            if not in_json and ch == "{":
-                in_json = True
-                depth = 1
-                buf = ch
-            elif in_json:
-                buf += ch
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        try:
-                            parsed = json.loads(buf)
-                            out.append(json.dumps(parsed, indent=2) + "\n")
-                        except Exception:
-                            out.append(buf.replace("\t", "  "))
-                        buf = ""
-                        in_json = False
-            else:
-                out.append(ch)
-            i += 1
-        if buf:
-            out.append(buf)
+        start = 0
+        brace = payload.find("{")
+        while brace != -1:
+            try:
+                parsed, end = JSON_DECODER.raw_decode(payload, brace)
+            except ValueError:
+                brace = payload.find("{", brace + 1)
+                continue
+            out.append(payload[start:brace])
+            out.append(json.dumps(parsed, indent=2) + "\n")
+            start = end
+            brace = payload.find("{", end)
+        out.append(payload[start:])
         text = "".join(out).replace("\t", "  ")
-        self.cli_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
-        self.cli_text.insertPlainText(text)
-        self.cli_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+        self._append_plain_text(self.cli_text, self._cli_cursor, text)
 
     def _append_monitor_batch(self, lines: list[str]) -> None:
+        # Entries arrive from the dispatcher as single log lines with color
+        # codes and line endings already removed, so the whole batch can be
+        # joined and filtered by the regex engine without a Python loop.
         if not lines:
             return
-        filtered = []
-        for raw in lines:
-            clean = raw.rstrip("\r\n")
-            if not clean:
-                continue
-            plain = _strip_ansi_prefix(clean)
-            match = LOG_LINE_RE.match(plain)
-            if match and match.group("tag").strip().upper() in ("BATT", "RSSI"):
-                continue
-            filtered.append(clean + "\n")
-        if not filtered:
+        text = MONITOR_HIDDEN_RE.sub("", "\n".join(lines) + "\n")
+        if not text:
             return
-        self.monitor_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
-        self.monitor_text.insertPlainText("".join(filtered))
-        self.monitor_text.moveCursor(QtGui.QTextCursor.MoveOperation.End)
+        # The monitor is strictly line-based, so it takes the block-append
+        # path: no trailing newline, and Qt follows the bottom by itself.
+        self.monitor_text.appendPlainText(text[:-1])
+
+    @staticmethod
+    def _append_plain_text(
+        view: QtWidgets.QPlainTextEdit, cursor: QtGui.QTextCursor, text: str
+    ) -> None:
+        # Writing through a document cursor skips the two moveCursor() calls,
+        # each of which lays out the view to keep the caret visible. Output is
+        # followed only while the view is scrolled to the bottom.
+        bar = view.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        if follow:
+            bar.setValue(bar.maximum())
 
     def _update_info_from_line(self, text: str) -> None:
-        plain = _strip_ansi_prefix(text)
+        # Substring checks skip the regexes on the vast majority of lines.
+        # BATT_RE is case-sensitive; RSSI_RE is not, so neither is its check.
         updated = False
-        batt_match = BATT_RE.search(plain)
+        batt_match = BATT_RE.search(text) if "BATT:" in text else None
         if batt_match:
             percent_raw = batt_match.group(1)
             voltage_raw = batt_match.group(2)
+            # "%g" of the rounded value drops trailing zeros in one step.
             try:
-                percent_val = float(percent_raw)
-                self.info_battery = f"{percent_val:.1f}".rstrip("0").rstrip(".")
+                self.info_battery = "%g" % round(float(percent_raw), 1)
             except ValueError:
                 self.info_battery = percent_raw.strip()
             try:
-                volt_val = float(voltage_raw)
-                self.info_voltage = f"{volt_val:.2f}".rstrip("0").rstrip(".")
+                self.info_voltage = "%g" % round(float(voltage_raw), 2)
             except ValueError:
                 self.info_voltage = voltage_raw.strip()
+            if self.info_voltage:
+                self._battery_segment = BATTERY_VOLTAGE_FORMAT % (
+                    self.info_battery,
+                    self.info_voltage,
+                )
+            else:
+                self._battery_segment = BATTERY_FORMAT % self.info_battery
             updated = True
-        rssi_match = RSSI_RE.search(plain)
+        rssi_match = RSSI_RE.search(text) if "rssi" in text.lower() else None
         if rssi_match:
             self.info_rssi = rssi_match.group(1).strip()
+            self._rssi_segment = RSSI_FORMAT % self.info_rssi
             updated = True
         if updated:
-            self._refresh_info_bar()
+            # Refreshed once at the end of _poll_queues, not per line.
+            self._info_dirty = True
 
     def _refresh_info_bar(self) -> None:
-        parts = [f"Transport: {self.transport_desc}"]
-        if self.info_battery != "--":
-            battery_segment = f"Battery: {self.info_battery}%"
-            if self.info_voltage:
-                battery_segment += f" ({self.info_voltage}V)"
-            parts.append(battery_segment)
-        else:
-            parts.append("Battery: --")
-        parts.append(
-            f"RSSI: {self.info_rssi} dBm" if self.info_rssi != "--" else "RSSI: --"
+        self._info_dirty = False
+        # Battery and RSSI segments are rebuilt only when their lines arrive.
+        info_text = INFO_BAR_FORMAT % (
+            self.transport_desc,
+            self._battery_segment,
+            self._rssi_segment,
         )
-        self.info_label.setText(" | ".join(parts))
+        if info_text != self._info_text:
+            self.info_label.setText(info_text)
+            self._info_text = info_text
         self._refresh_orientation_title()
 
     def _refresh_orientation_title(self) -> None:
+        # Compare against the cached string; get_title() walks the Text artist.
         title = f"Active orientation ({self.orientation_source})"
-        if self.ax_orientation.get_title() != title:
+        if self._orientation_title != title:
+            # set_title marks the figure stale; the next plot tick redraws it.
             self.ax_orientation.set_title(title)
-            self.canvas.draw_idle()
+            self._orientation_title = title
 
     def _hist_back(self) -> None:
         if not hasattr(self, "cli_history") or not self.cli_history:
@@ -1476,7 +1765,7 @@ class DashboardWindow(QtWidgets.QMainWindow):
         self.flex_value_label = ax.text(
             0.02,
             0.5,
-            "MIDI: --  Raw: --  Index: --",
+            FLEX_IDLE_TEXT,
             transform=ax.transAxes,
             ha="left",
             va="center",
@@ -1485,22 +1774,35 @@ class DashboardWindow(QtWidgets.QMainWindow):
         )
 
     def _add_unit_sphere(self, ax, radius: float) -> None:
-        phi = np.linspace(0.0, np.pi, 20)
-        theta = np.linspace(0.0, 2.0 * np.pi, 40)
-        x = radius * np.outer(np.sin(phi), np.cos(theta))
-        y = radius * np.outer(np.sin(phi), np.sin(theta))
-        z = radius * np.outer(np.cos(phi), np.ones_like(theta))
-        ax.plot_wireframe(x, y, z, color="#B0B0B0", linewidth=0.4, alpha=0.35)
+        # Same 20x40 grid plot_wireframe drew, minus its stride and autoscale
+        # passes; the axes limits are fixed right after this anyway.
+        lines = _unit_sphere_lines(20, 40)
+        if radius != 1.0:
+            lines = lines * np.float32(radius)
+        ax.add_collection3d(
+            Line3DCollection(lines, color="#B0B0B0", linewidth=0.4, alpha=0.35)
+        )
 
     # ------------------------- Transport start/update -------------------------
 
     def _attempt_ble_start(self) -> Optional[BleTelemetryClient]:
-        target, logs = _resolve_ble_target_sync(
-            self.args.ble_name, self.args.ble_address, self.args.ble_scan_time
-        )
+        # The start-up scan runs on the loop the client then takes over, so a
+        # BLE session sets up one event loop instead of two.
+        loop = asyncio.new_event_loop()
+        try:
+            target, logs = _resolve_ble_target_sync(
+                self.args.ble_name,
+                self.args.ble_address,
+                self.args.ble_scan_time,
+                loop,
+            )
+        except BaseException:
+            loop.close()
+            raise
         for msg in logs:
             self.status_queue.put(msg)
         if target is None:
+            loop.close()
             return None
         client = BleTelemetryClient(
             name_hint=self.args.ble_name,
@@ -1509,6 +1811,7 @@ class DashboardWindow(QtWidgets.QMainWindow):
             timeout=self.args.ble_timeout,
             dispatcher=self.dispatcher,
             status_queue=self.status_queue,
+            loop=loop,
         )
         client.start()
         self.transport_desc = "BLE (connecting)"
@@ -1520,12 +1823,12 @@ class DashboardWindow(QtWidgets.QMainWindow):
             return
         client = getattr(self, "client", None)
         if client is None or not hasattr(client, "send_text"):
-            self.status_queue.put("Transport unavailable; command skipped.")
+            self.status_queue.put(("command_skipped",))
             return
         try:
             client.send_text(command)
         except Exception as exc:  # pragma: no cover - best effort logging
-            self.status_queue.put(f"Command send failed: {exc}")
+            self.status_queue.put(("command_failed", exc))
 
     def _start_transport(self):
         if self.ble_preferred:
@@ -1540,7 +1843,7 @@ class DashboardWindow(QtWidgets.QMainWindow):
                 )
                 QtCore.QTimer.singleShot(0, self.close)
                 raise SystemExit(1)
-            self.status_queue.put("BLE: falling back to serial.")
+            self.status_queue.put(("ble_fallback",))
             self.transport_desc = "Serial (connecting)"
             self._refresh_info_bar()
         else:
@@ -1570,179 +1873,237 @@ class DashboardWindow(QtWidgets.QMainWindow):
         client.start()
         return client
 
-    def _update_transport_from_status(self, status: str) -> None:
-        normalized = status.strip()
-        lower = normalized.lower()
-        if lower.startswith("serial connected:"):
-            self.transport_desc = normalized.replace(
-                "Serial connected:", "Serial"
-            ).strip()
-        elif "serial" in lower and ("disconnected" in lower or "failed" in lower):
-            self.transport_desc = "Serial (disconnected)"
-        elif "serial" in lower and "waiting" in lower:
-            self.transport_desc = "Serial (reconnecting)"
-        elif lower.startswith("ble connected"):
-            self.transport_desc = "BLE (connected)"
-        elif "ble" in lower and "disconnected" in lower:
-            self.transport_desc = "BLE (reconnecting)"
-        elif lower.startswith("ble: found"):
-            self.transport_desc = normalized.replace("BLE: ", "BLE ")
-        elif lower.startswith("ble: scanning"):
-            self.transport_desc = "BLE (scanning)"
-        elif "ble" in lower and "not found" in lower:
-            self.transport_desc = "BLE (reconnecting)"
-        elif "falling back to serial" in lower:
-            self.transport_desc = "Serial (connecting)"
-        elif lower.startswith("ble unavailable"):
-            self.transport_desc = "BLE (unavailable)"
-
-    # ------------------------- Queue polling and plotting ---------------------
-
-    def _drain_queue(self, source: "queue.Queue[str]") -> list[str]:
-        items: list[str] = []
-        while True:
-            try:
-                items.append(source.get_nowait())
-            except queue.Empty:
-                break
-        return items
+    # ------------------------- Queue draining and plotting --------------------
 
     def _poll_queues(self) -> None:
-        processed = False
-        cli_batch = self._drain_queue(self.cli_queue)
+        cli_batch = self.cli_queue.drain()
         if cli_batch:
-            processed = True
             self._append_cli_output_batch(cli_batch)
             for entry in cli_batch:
                 self._update_info_from_line(entry)
 
-        monitor_batch = self._drain_queue(self.monitor_queue)
+        monitor_batch = self.monitor_queue.drain()
         if monitor_batch:
-            processed = True
             self._append_monitor_batch(monitor_batch)
             for entry in monitor_batch:
                 self._update_info_from_line(entry)
 
-        status_batch = self._drain_queue(self.status_queue)
-        for status in status_batch:
-            processed = True
-            self.status_label.setText(status)
-            self._update_transport_from_status(status)
+        status_batch = self.status_queue.drain()
+        if status_batch:
+            self._apply_status_batch(status_batch)
+
+        if self._info_dirty:
             self._refresh_info_bar()
 
-        if processed:
-            # throttle next spin if we were busy; timer interval is fixed
-            pass
+    def _apply_status_batch(self, batch: list[StatusItem]) -> None:
+        # Only the newest message is shown and only the newest transport
+        # change sticks, so everything older is dropped unformatted.
+        tag, *args = batch[-1]
+        template, _ = STATUS_MESSAGES[tag]
+        status_text = template.format(*args)
+        if status_text != self._status_text:
+            self.status_label.setText(status_text)
+            self._status_text = status_text
+        for tag, *args in reversed(batch):
+            _, transport = STATUS_MESSAGES[tag]
+            if transport is not None:
+                self.transport_desc = transport.format(*args)
+                break
+        self._info_dirty = True
+
+    def _resume_plot_timer(self) -> None:
+        if not self.plot_timer.isActive():
+            self.plot_timer.start()
+
+    def _next_expiry(self, snap: TelemetrySnapshot, now: float) -> float:
+        # Earliest future moment a punch, compass or flex reading times out.
+        deadline = math.inf
+        for ts, timeout in (
+            (snap.punch_ts, self.punch_display_duration),
+            (snap.mag_ts, self.compass_stale_timeout),
+            (snap.flex_ts, self.flex_meter_stale_timeout),
+        ):
+            expiry = ts + timeout
+            if ts > 0.0 and timeout > 0.0 and now <= expiry < deadline:
+                deadline = expiry
+        return deadline
 
     def _update_plot(self) -> None:  # pragma: no cover
-        (
-            _fusion_quat,
-            _sflp_quat,
-            active,
-            active_source,
-            position,
-            pos_ts,
-            punch,
-            punch_ts,
-            magnetometer,
-            mag_ts,
-            flex_value,
-            flex_raw,
-            flex_midi,
-            flex_ts,
-        ) = self.telemetry.snapshot()
+        snap = self.telemetry.snapshot()
         now = time.time()
+        # Snapshots are replaced on every ingested sample, so an identical one
+        # means no new data; only a pending timeout or a static artist change
+        # (e.g. the title) still needs this tick.
+        if (
+            snap is self._drawn_snapshot
+            and now <= self._redraw_deadline
+            and not self.figure.stale
+        ):
+            if self._redraw_deadline == math.inf:
+                # Fully idle: stop ticking until the next sample arrives.
+                self.plot_timer.stop()
+                self.telemetry.arm_wakeup()
+                if self.telemetry.snapshot() is not snap:
+                    self.plot_timer.start()
+            return
+        if snap is not self._drawn_snapshot or now > self._redraw_deadline:
+            self._drawn_snapshot = snap
+            self._redraw_deadline = self._next_expiry(snap, now)
+        active = snap.active
+        position = snap.position
 
         pretty_source = getattr(self, "orientation_source", "Waiting")
 
         if active is not None:
-            rot_active = quat_to_rotation_matrix(active)
-            pointer = np.multiply(
-                rot_active @ self.base_vec, self.orientation_radius
-            )
-            self.active_pointer_line.set_data([0.0, pointer[0]], [0.0, pointer[1]])
-            cast(Any, self.active_pointer_line).set_3d_properties([0.0, pointer[2]])
-            cast(Any, self.active_marker)._offsets3d = (
-                [pointer[0]],
-                [pointer[1]],
-                [pointer[2]],
-            )
-            roll, pitch, yaw = self._quat_to_euler_deg(active)
-            if active_source == "fusion":
-                source_label = "Fusion"
-            elif active_source == "sflp":
-                source_label = "SFLP"
-            else:
-                source_label = "Unknown"
-            self.active_angles_label.set_text(
-                f"[{source_label}] Roll: {roll:+.1f} deg, Pitch: {pitch:+.1f} deg, Yaw: {yaw:+.1f} deg"
-            )
+            source_label = ORIENTATION_SOURCE_LABELS.get(snap.source, "Unknown")
+            # Snapshots reuse the same tuple until a new sample lands, so an
+            # unchanged orientation costs nothing and leaves its band clean.
+            if active is not self._shown_active:
+                self._shown_active = active
+                # The marker buffer is a view of the pointer tip, so one write
+                # moves both.
+                rotate_vec_by_quat(
+                    active,
+                    self.base_vec,
+                    self._pointer_xyz[:, 1],
+                    self.orientation_radius,
+                )
+                self.active_pointer_line.set_data_3d(*self._pointer_xyz)
+                self.active_marker.set_data_3d(*self._marker_xyz)
+                self.active_angles_label.set_text(
+                    ANGLES_FORMAT % (source_label, *quat_to_euler_deg(active))
+                )
             pretty_source = source_label
         else:
+            self._shown_active = None
             self.active_angles_label.set_text("Active orientation unavailable")
             pretty_source = "Unavailable" if pretty_source != "Waiting" else "Waiting"
 
-        self._update_punch_indicator(punch, punch_ts, now)
-        self._update_compass(magnetometer, mag_ts, now)
-        self._update_flex_meter(flex_value, flex_raw, flex_midi, flex_ts, now)
+        self._update_punch_indicator(snap.punch, snap.punch_ts, now)
+        self._update_compass(snap.mag, snap.mag_ts, now)
+        self._update_flex_meter(
+            snap.flex_value, snap.flex_raw, snap.flex_midi, snap.flex_ts, now
+        )
 
         if pretty_source != getattr(self, "orientation_source", ""):
             self.orientation_source = pretty_source
             self._refresh_info_bar()
 
-        if position is not None and pos_ts > self.last_position_ts:
-            self.last_position_ts = pos_ts
-            self.position_trail.append(position)
-            self.position_point.set_data([position[0]], [position[1]])
-            cast(Any, self.position_point).set_3d_properties([position[2]])
-            self.position_label.set_text(
-                f"Pos: ({position[0]:+.2f}, {position[1]:+.2f}, {position[2]:+.2f})"
+        if position is not None and snap.position_ts > self.last_position_ts:
+            self.last_position_ts = snap.position_ts
+            trail = self._append_trail(position)
+            # The newest trail column doubles as the position marker.
+            self.position_point.set_data_3d(*trail[:, -1:])
+            self.position_label.set_text(POSITION_FORMAT % position)
+            self.trail_line.set_data_3d(*trail)
+            target = max(0.3, self._trail_extent * 1.4)
+            radius = self._last_trail_radius
+            # New limits force a full redraw, so they snap to powers of two and
+            # only shrink once the trail fits well inside the next size down;
+            # a trail hovering at a boundary then cannot flip between two.
+            if target > radius or target < 0.4 * radius:
+                radius = 2.0 ** math.ceil(math.log2(target))
+                # Each call only flags the view; projection and ticks are
+                # rebuilt once by the next draw. Nothing listens for limit
+                # changes on these unshared axes, so skip the callbacks.
+                limits = (-radius, radius)
+                self.ax_position.set_xlim(limits, emit=False)
+                self.ax_position.set_ylim(limits, emit=False)
+                self.ax_position.set_zlim(limits, emit=False)
+                self._last_trail_radius = radius
+
+        if self.figure.stale or self._blit_regions is None:
+            # Animated artists never mark the figure stale, so a stale figure
+            # means a static artist changed and needs a full draw.
+            self.canvas.draw_idle()
+            return
+        dirty = []
+        for box, background, artists in self._blit_regions:
+            if any(artist.stale for artist in artists):
+                self.canvas.restore_region(background)
+                self._draw_animated(artists)
+                dirty.append(box)
+        if dirty:
+            self.canvas.blit(Bbox.union(dirty))
+
+    def _append_trail(self, position: Tuple[float, float, float]) -> np.ndarray:
+        """Store a sample and return a (3, count) oldest-first view of the trail."""
+        length = self.trail_length
+        head = self._trail_head
+        x, y, z = position
+        extent = max(abs(x), abs(y), abs(z))
+        # Only evicting the point that set the extent forces a rescan.
+        rescan = self._trail_count == length and (
+            max(abs(v) for v in self._trail[:, head].tolist()) >= self._trail_extent
+        )
+        self._trail[:, head] = position
+        self._trail[:, head + length] = position
+        self._trail_head = (head + 1) % length
+        self._trail_count = min(self._trail_count + 1, length)
+        end = self._trail_head + length
+        trail = self._trail[:, end - self._trail_count : end]
+        if rescan:
+            # Two reductions instead of np.abs(), which would allocate a
+            # trail-sized temporary.
+            self._trail_extent = max(float(trail.max()), -float(trail.min()))
+        elif extent > self._trail_extent:
+            self._trail_extent = extent
+        return trail
+
+    def _on_canvas_draw(self, event) -> None:
+        # Every full draw (first show, resize, view rotation, static updates)
+        # refreshes the cached backgrounds, then paints the animated artists.
+        # Bands span the figure width because labels can run past their axes,
+        # and grow vertically to cover text placed outside the axes, padded by
+        # half a line since later text may have deeper descenders.
+        renderer = event.renderer
+        fig_box = self.figure.bbox
+        regions = []
+        for axes, artists in self._blit_groups:
+            boxes = [ax.bbox for ax in axes]
+            boxes.extend(
+                artist.get_window_extent(renderer).padded(
+                    renderer.points_to_pixels(artist.get_fontsize()) / 2
+                )
+                for artist in artists
+                if isinstance(artist, Text)
             )
-            if self.position_trail:
-                trail = np.vstack(self.position_trail)
-                self.trail_line.set_data(trail[:, 0], trail[:, 1])
-                cast(Any, self.trail_line).set_3d_properties(trail[:, 2])
-                max_extent = float(np.max(np.abs(trail)))
-                target = max(0.3, max_extent * 1.4)
-                if target > 0 and abs(target - self._last_trail_radius) > 0.05:
-                    self.ax_position.set_xlim([-target, target])
-                    self.ax_position.set_ylim([-target, target])
-                    self.ax_position.set_zlim([-target, target])
-                    self._last_trail_radius = target
-
-        self.canvas.draw_idle()
-
-    @staticmethod
-    def _quat_to_euler_deg(
-        quat: Tuple[float, float, float, float],
-    ) -> tuple[float, float, float]:
-        w, x, y, z = quat
-        t0 = 2.0 * (w * x + y * z)
-        t1 = 1.0 - 2.0 * (x * x + y * y)
-        roll = math.degrees(math.atan2(t0, t1))
-        t2 = 2.0 * (w * y - z * x)
-        t2 = max(-1.0, min(1.0, t2))
-        pitch = math.degrees(math.asin(t2))
-        t3 = 2.0 * (w * z + x * y)
-        t4 = 1.0 - 2.0 * (y * y + z * z)
-        yaw = math.degrees(math.atan2(t3, t4))
-        return roll, pitch, yaw
+            box = Bbox.from_extents(
+                fig_box.x0,
+                min(b.y0 for b in boxes),
+                fig_box.x1,
+                max(b.y1 for b in boxes),
+            )
+            regions.append((box, self.canvas.copy_from_bbox(box), artists))
+        # Copy every background before painting so no band captures another
+        # band's live artists.
+        for _box, _background, artists in regions:
+            self._draw_animated(artists)
+        self._blit_regions = regions
+
+    def _draw_animated(self, artists: tuple) -> None:
+        for artist in artists:
+            artist.axes.draw_artist(artist)
+            # Hidden artists skip draw() and would otherwise stay stale,
+            # keeping their band dirty on every tick.
+            artist.stale = False
 
     @staticmethod
-    def _angles_to_direction(horizontal_deg: float, vertical_deg: float) -> np.ndarray:
-        if not (math.isfinite(horizontal_deg) and math.isfinite(vertical_deg)):
-            return np.zeros(3, dtype=float)
-        horizontal_rad = math.radians(horizontal_deg)
-        vertical_rad = math.radians(vertical_deg)
-        cos_vertical = math.cos(vertical_rad)
-        return np.array(
-            [
-                cos_vertical * math.cos(horizontal_rad),
-                cos_vertical * math.sin(horizontal_rad),
-                math.sin(vertical_rad),
-            ],
-            dtype=float,
-        )
+    def _angles_to_direction(
+        horizontal_deg: float,
+        vertical_deg: float,
+        out: np.ndarray,
+        scale: float = 1.0,
+    ) -> np.ndarray:
+        # The spherical direction is already unit length, so it is scaled and
+        # written straight into `out`. parse_punch only yields finite angles.
+        horizontal_rad = horizontal_deg * DEG_TO_RAD
+        vertical_rad = vertical_deg * DEG_TO_RAD
+        cos_vertical = math.cos(vertical_rad) * scale
+        out[0] = cos_vertical * math.cos(horizontal_rad)
+        out[1] = cos_vertical * math.sin(horizontal_rad)
+        out[2] = math.sin(vertical_rad) * scale
+        return out
 
     def _update_punch_indicator(
         self,
@@ -1752,45 +2113,42 @@ class DashboardWindow(QtWidgets.QMainWindow):
     ) -> None:
         if self.punch_line is None:
             return
+        if (
+            punch is None
+            or self.punch_display_duration <= 0.0
+            or (now - punch_ts) > self.punch_display_duration
+        ):
+            punch = None
+        if punch is self._shown_punch:
+            return
+        self._shown_punch = punch
         visible = False
-        if punch is not None and self.punch_display_duration > 0.0:
+        if punch is not None:
             velocity, horizontal_deg, vertical_deg = punch
-            if (
-                velocity > 0.0
-                and math.isfinite(velocity)
-                and (now - punch_ts) <= self.punch_display_duration
-            ):
-                direction = self._angles_to_direction(horizontal_deg, vertical_deg)
-                norm = float(np.linalg.norm(direction))
-                if norm > 1e-6:
-                    unit_dir = direction / norm
-                    length_ratio = (
-                        0.0
-                        if self.punch_velocity_full_scale <= 0.0
-                        else velocity / self.punch_velocity_full_scale
-                    )
-                    length_ratio = max(0.0, min(length_ratio, 1.5))
-                    length = length_ratio * self.orientation_radius
-                    endpoint = np.multiply(unit_dir, length)
-                    self.punch_line.set_data(
-                        [0.0, float(endpoint[0])], [0.0, float(endpoint[1])]
-                    )
-                    cast(Any, self.punch_line).set_3d_properties(
-                        [0.0, float(endpoint[2])]
-                    )
-                    self.punch_line.set_visible(True)
-                    self.punch_line.set_alpha(0.9)
-                    visible = True
+            if velocity > 0.0:
+                length_ratio = min(velocity * self._inv_punch_full_scale, 1.5)
+                length = length_ratio * self.orientation_radius
+                self._angles_to_direction(
+                    horizontal_deg, vertical_deg, self._punch_xyz[:, 1], length
+                )
+                self.punch_line.set_data_3d(*self._punch_xyz)
+                self.punch_line.set_visible(True)
+                visible = True
         if not visible:
+            # The stale endpoint stays in the buffer; a hidden line is not drawn.
             self.punch_line.set_visible(False)
-            self.punch_line.set_alpha(0.0)
-            self.punch_line.set_data([0.0, 0.0], [0.0, 0.0])
-            cast(Any, self.punch_line).set_3d_properties([0.0, 0.0])
 
     def _update_compass(
-        self, mag_vec: Optional[np.ndarray], mag_ts: float, now: float
+        self,
+        mag_vec: Optional[Tuple[float, float, float]],
+        mag_ts: float,
+        now: float,
     ) -> None:
-        stale = mag_vec is None or mag_ts <= 0.0 or (now - mag_ts) > 3.0
+        stale = mag_vec is None or mag_ts <= 0.0 or (now - mag_ts) > self.compass_stale_timeout
+        shown = None if stale else mag_vec
+        if shown is self._shown_mag:
+            return
+        self._shown_mag = shown
         if stale:
             self.compass_line.set_visible(False)
             self.compass_marker.set_visible(False)
@@ -1798,37 +2156,34 @@ class DashboardWindow(QtWidgets.QMainWindow):
             self.compass_field_label.set_text("|B|: -- µT")
             return
         assert mag_vec is not None
-        mag = np.asarray(mag_vec, dtype=float)
-        mx, my, mz = (float(mag[0]), float(mag[1]), float(mag[2]))
-        horizontal = np.array([mx, my], dtype=float)
-        horizontal_norm = float(np.linalg.norm(horizontal))
-        field_norm = float(np.linalg.norm(mag))
+        mx, my, mz = mag_vec
+        horizontal_norm = math.hypot(mx, my)
+        field_norm = math.hypot(mx, my, mz)
         if horizontal_norm < 1e-4:
             self.compass_line.set_visible(False)
             self.compass_marker.set_visible(False)
             self.compass_heading_label.set_text("Heading: --")
-            self.compass_field_label.set_text(f"|B|: {field_norm:5.1f} µT")
+            self.compass_field_label.set_text(FIELD_FORMAT % field_norm)
             return
-        unit = horizontal / horizontal_norm
-        if self.compass_full_scale <= 0.0:
-            length = self.compass_max_radius
+        inv_full_scale = self._inv_compass_full_scale
+        if inv_full_scale > 0.0 and horizontal_norm * inv_full_scale < 1.0:
+            # Below full scale the arrow is simply proportional to the field.
+            scale = inv_full_scale * self.compass_max_radius
         else:
-            length = (
-                min(horizontal_norm / self.compass_full_scale, 1.0)
-                * self.compass_max_radius
-            )
-        endpoint = np.multiply(unit, length)
-        self.compass_line.set_data([0.0, float(endpoint[0])], [0.0, float(endpoint[1])])
-        self.compass_marker.set_data([float(endpoint[0])], [float(endpoint[1])])
+            scale = self.compass_max_radius / horizontal_norm
+        end_x = mx * scale
+        end_y = my * scale
+        self.compass_line.set_data([0.0, end_x], [0.0, end_y])
+        self.compass_marker.set_data([end_x], [end_y])
         self.compass_line.set_visible(True)
         self.compass_marker.set_visible(True)
-        heading_deg = math.degrees(math.atan2(unit[1], unit[0]))
+        heading_deg = math.degrees(math.atan2(my, mx))
         if heading_deg > 180.0:
             heading_deg -= 360.0
         elif heading_deg < -180.0:
             heading_deg += 360.0
-        self.compass_heading_label.set_text(f"Heading: {heading_deg:+.1f}°")
-        self.compass_field_label.set_text(f"|B|: {field_norm:5.1f} µT")
+        self.compass_heading_label.set_text(HEADING_FORMAT % heading_deg)
+        self.compass_field_label.set_text(FIELD_FORMAT % field_norm)
 
     def _update_flex_meter(
         self,
@@ -1845,22 +2200,33 @@ class DashboardWindow(QtWidgets.QMainWindow):
             or flex_ts <= 0.0
             or (self.flex_meter_stale_timeout > 0.0 and (now - flex_ts) > self.flex_meter_stale_timeout)
         )
+        shown = None if stale else (flex_value, flex_raw, flex_midi)
+        if shown == self._shown_flex:
+            return
+        was_idle = self._shown_flex is None
+        self._shown_flex = shown
         if stale:
             self.flex_bar.set_width(0.0)
             self.flex_bar.set_alpha(0.2)
-            self.flex_value_label.set_text("MIDI: --  Raw: --  Index: --")
+            self.flex_value_label.set_text(FLEX_IDLE_TEXT)
             self.flex_value_label.set_color("#606060")
             return
         assert flex_midi is not None
         level = max(0, min(int(self.flex_meter_full_scale), int(flex_midi)))
         self.flex_bar.set_width(level)
-        self.flex_bar.set_alpha(0.85)
-        raw_display = "--" if flex_raw is None else f"{flex_raw}"
-        index_display = "--" if flex_value is None else f"{flex_value}"
         self.flex_value_label.set_text(
-            f"MIDI: {level:3d}  Raw: {raw_display}  Index: {index_display}"
+            FLEX_LABEL_FORMAT
+            % (
+                level,
+                "--" if flex_raw is None else flex_raw,
+                "--" if flex_value is None else flex_value,
+            )
         )
-        self.flex_value_label.set_color("#1E90FF")
+        if was_idle:
+            # set_alpha/set_color invalidate even when unchanged; the live
+            # styling only needs applying when leaving the idle state.
+            self.flex_bar.set_alpha(0.85)
+            self.flex_value_label.set_color("#1E90FF")
 
     # ------------------------- Close and save ---------------------------------
 
@@ -1877,47 +2243,41 @@ class DashboardWindow(QtWidgets.QMainWindow):
 
 async def _resolve_ble_target_async(
     name_hint: Optional[str], address: Optional[str], scan_time: float
-) -> tuple[Optional[str], list[str]]:
+) -> tuple[Optional[str], list[StatusItem]]:
     # This helper mirrors the original behavior for BLE pre-resolution.
-    try:
-        from bleak import BleakScanner  # type: ignore[import]
-    except Exception as exc:
-        return None, [f"BLE unavailable: {exc}"]
+    bleak, exc = _load_bleak()
+    if bleak is None:
+        return None, [("ble_unavailable", exc)]
     if address:
-        return address, [f"BLE: connecting to {address} ..."]
+        return address, [("ble_connecting", address)]
     hint = (name_hint or BLE_DEFAULT_NAME_HINT).lower()
-    logs = [f"BLE: scanning for devices matching '{hint}' ({scan_time:.1f}s timeout)"]
+    logs: list[StatusItem] = [("ble_scanning", hint, scan_time)]
 
     def _matches(device, adv_data):
         name = (device.name or "").lower()
         adv_name = (adv_data.local_name or "").lower()
         return hint in name or hint in adv_name
 
-    device = await BleakScanner.find_device_by_filter(_matches, timeout=scan_time)
+    device = await bleak.BleakScanner.find_device_by_filter(
+        _matches, timeout=scan_time
+    )
     if not device:
-        logs.append("BLE: device not found.")
+        logs.append(("ble_not_found",))
         return None, logs
-    logs.append(
-        f"BLE: found {device.name or 'Unnamed'} ({device.address}). Connecting..."
-    )
+    logs.append(("ble_found", device.name or "Unnamed", device.address))
     return device.address, logs
 
 
 def _resolve_ble_target_sync(
-    name_hint: Optional[str], address: Optional[str], scan_time: float
-) -> tuple[Optional[str], list[str]]:
-    try:
-        return asyncio.run(_resolve_ble_target_async(name_hint, address, scan_time))
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        try:
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(
-                _resolve_ble_target_async(name_hint, address, scan_time)
-            )
-        finally:
-            asyncio.set_event_loop(None)
-            loop.close()
+    name_hint: Optional[str],
+    address: Optional[str],
+    scan_time: float,
+    loop: asyncio.AbstractEventLoop,
+) -> tuple[Optional[str], list[StatusItem]]:
+    # Runs on a loop that is not running yet; the caller decides its lifetime.
+    return loop.run_until_complete(
+        _resolve_ble_target_async(name_hint, address, scan_time)
+    )
 
 
 # ----------------------------- Args and main ----------------------------------
@@ -2006,10 +2366,22 @@ def main() -> None:
     win = DashboardWindow(args)
     win.resize(1280, 820)
     win.show()
-    # Let SIGINT close the app from terminal
-    timer = QtCore.QTimer()
-    timer.start(200)
-    timer.timeout.connect(lambda: None)
+    # Let SIGINT close the app from terminal. Python only runs signal handlers
+    # once control is back in the interpreter, so the Qt loop has to wake up.
+    if os.name == "posix":
+        # The signal's wakeup fd makes the loop wake exactly when one arrives.
+        wakeup_read, wakeup_write = socket.socketpair()
+        wakeup_read.setblocking(False)
+        wakeup_write.setblocking(False)
+        signal.set_wakeup_fd(wakeup_write.fileno())
+        notifier = QtCore.QSocketNotifier(
+            wakeup_read.fileno(), QtCore.QSocketNotifier.Type.Read, app
+        )
+        notifier.activated.connect(lambda *_: wakeup_read.recv(64))
+    else:
+        timer = QtCore.QTimer()
+        timer.start(200)
+        timer.timeout.connect(lambda: None)
     sys.exit(app.exec())
 
 
@@ -0,0 +1,54 @@
+"""Regression tests for dashboard.py.
+
+Run from the repository root: python -m unittest discover -s tests
+"""
+
+import unittest
+from types import SimpleNamespace
+
+import dashboard
+
+
+class ParseTelemetryLineTests(unittest.TestCase):
+    def test_every_record_on_a_line(self):
+        records = dict(dashboard.parse_telemetry_line("FUSION q:[1,0,0,0] POS:[1,2,3]"))
+        self.assertEqual(records["fusion"], (1.0, 0.0, 0.0, 0.0))
+        self.assertEqual(records["pos"], (1.0, 2.0, 3.0))
+
+    def test_unclosed_payload_does_not_swallow_later_records(self):
+        records = dict(dashboard.parse_telemetry_line("POS:[ | FUSION q:[0.5,0.5,0.5,0.5]"))
+        self.assertEqual(records, {"fusion": (0.5, 0.5, 0.5, 0.5)})
+
+        records = dict(dashboard.parse_telemetry_line("POS:[1,2,3] | POS:[ | M:[10,20,30]"))
+        self.assertEqual(records, {"pos": (1.0, 2.0, 3.0), "mag": (10.0, 20.0, 30.0)})
+
+    def test_flex_after_bare_log_tag(self):
+        records = dict(
+            dashboard.parse_telemetry_line(
+                "I (1) FLEX: FLEX: Flex value changed: 1 -> 2 (raw median: 3, MIDI: 4)"
+            )
+        )
+        self.assertEqual(records, {"flex": (2, 3, 4)})
+
+
+class InfoBarTests(unittest.TestCase):
+    def _info_state(self):
+        return SimpleNamespace(info_rssi="--", _rssi_segment="RSSI: --", _info_dirty=False)
+
+    def test_rssi_line_in_any_case_updates_info(self):
+        cases = (
+            ("I (60) app: rssi: -47 dBm", "-47"),
+            ("Rssi=-50dBm", "-50"),
+            ("I (61) app: RSSI: -61 dBm", "-61"),
+        )
+        for line, expected in cases:
+            with self.subTest(line=line):
+                state = self._info_state()
+                dashboard.DashboardWindow._update_info_from_line(state, line)
+                self.assertEqual(state.info_rssi, expected)
+                self.assertEqual(state._rssi_segment, dashboard.RSSI_FORMAT % expected)
+                self.assertTrue(state._info_dirty)
+
+
+if __name__ == "__main__":
+    unittest.main()